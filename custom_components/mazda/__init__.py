@@ -4,13 +4,15 @@ from __future__ import annotations
 import asyncio
 from datetime import timedelta
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Final
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, CONF_REGION, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, async_get_hass, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryNotReady,
@@ -28,19 +30,27 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from .const import DATA_CLIENT, DATA_COORDINATOR, DATA_REGION, DATA_VEHICLES, DOMAIN
+from .const import (
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DATA_REGION,
+    DATA_VEHICLES,
+    DATA_VIN_INDEX,
+    DOMAIN,
+)
 from .pymazda.client import Client as MazdaAPI
 from .pymazda.exceptions import (
     MazdaAccountLockedException,
     MazdaAPIEncryptionException,
     MazdaAuthenticationException,
     MazdaException,
+    MazdaLoginFailedException,
     MazdaTokenExpiredException,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [
+PLATFORMS: Final = (
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
     Platform.CLIMATE,
@@ -48,7 +58,53 @@ PLATFORMS = [
     Platform.LOCK,
     Platform.SENSOR,
     Platform.SWITCH,
-]
+)
+
+UPDATE_INTERVAL = timedelta(seconds=180)
+MAX_UPDATE_INTERVAL = timedelta(minutes=15)
+
+# Errors that can be raised by a request to the Mazda API
+MAZDA_ERRORS = (
+    MazdaException,
+    MazdaAuthenticationException,
+    MazdaAccountLockedException,
+    MazdaTokenExpiredException,
+    MazdaAPIEncryptionException,
+    MazdaLoginFailedException,
+    aiohttp.ClientError,
+    TimeoutError,
+)
+
+
+@callback
+def async_reset_update_interval(coordinator: DataUpdateCoordinator) -> None:
+    """Go back to the regular poll interval after a command was sent to a vehicle."""
+    coordinator.update_interval = UPDATE_INTERVAL
+    # The refresh timer is only rescheduled when new data is set
+    coordinator.async_set_updated_data(coordinator.data)
+
+
+def validate_mazda_device_id(device_id):
+    """Check that a device ID exists in the registry and has at least one 'mazda' identifier."""
+    dev_reg = dr.async_get(async_get_hass())
+
+    if (device_entry := dev_reg.async_get(device_id)) is None:
+        raise vol.Invalid("Invalid device ID")
+
+    if not any(domain == DOMAIN for domain, _ in device_entry.identifiers):
+        raise vol.Invalid("Device ID is not a Mazda vehicle")
+
+    return device_id
+
+
+SERVICE_SCHEMA_SEND_POI = vol.Schema(
+    {
+        vol.Required("device_id"): vol.All(cv.string, validate_mazda_device_id),
+        vol.Required("latitude"): cv.latitude,
+        vol.Required("longitude"): cv.longitude,
+        vol.Required("poi_name"): cv.string,
+    }
+)
 
 
 async def with_timeout(task, timeout_seconds=30):
@@ -72,12 +128,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await mazda_client.validate_credentials()
     except MazdaAuthenticationException as ex:
         raise ConfigEntryAuthFailed from ex
-    except (
-        MazdaException,
-        MazdaAccountLockedException,
-        MazdaTokenExpiredException,
-        MazdaAPIEncryptionException,
-    ) as ex:
+    except MAZDA_ERRORS as ex:
         _LOGGER.error("Error occurred during Mazda login request: %s", ex)
         raise ConfigEntryNotReady from ex
 
@@ -92,23 +143,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             assert device_entry
 
         # Get vehicle VIN from device identifiers
-        mazda_identifiers = (
-            identifier
-            for identifier in device_entry.identifiers
-            if identifier[0] == DOMAIN
+        for domain, vin in device_entry.identifiers:
+            if domain == DOMAIN:
+                break
+        else:
+            raise HomeAssistantError("Device ID is not a Mazda vehicle")
+
+        # Get vehicle ID and API client from the VIN index
+        api_client, vehicle_id = hass.data[DOMAIN][DATA_VIN_INDEX].get(
+            vin, (None, 0)
         )
-        vin_identifier = next(mazda_identifiers)
-        vin = vin_identifier[1]
-
-        # Get vehicle ID and API client from hass.data
-        vehicle_id = 0
-        api_client = None
-        for entry_data in hass.data[DOMAIN].values():
-            for vehicle in entry_data[DATA_VEHICLES]:
-                if vehicle["vin"] == vin:
-                    vehicle_id = vehicle["id"]
-                    api_client = entry_data[DATA_CLIENT]
-                    break
 
         if vehicle_id == 0 or api_client is None:
             raise HomeAssistantError("Vehicle ID not found")
@@ -119,43 +163,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             longitude = service_call.data["longitude"]
             poi_name = service_call.data["poi_name"]
             await api_method(vehicle_id, latitude, longitude, poi_name)
-        except Exception as ex:
+        except MAZDA_ERRORS as ex:
             raise HomeAssistantError(ex) from ex
 
-    def validate_mazda_device_id(device_id):
-        """Check that a device ID exists in the registry and has at least one 'mazda' identifier."""
-        dev_reg = dr.async_get(hass)
-
-        if (device_entry := dev_reg.async_get(device_id)) is None:
-            raise vol.Invalid("Invalid device ID")
-
-        mazda_identifiers = [
-            identifier
-            for identifier in device_entry.identifiers
-            if identifier[0] == DOMAIN
-        ]
-        if not mazda_identifiers:
-            raise vol.Invalid("Device ID is not a Mazda vehicle")
-
-        return device_id
-
-    service_schema_send_poi = vol.Schema(
-        {
-            vol.Required("device_id"): vol.All(cv.string, validate_mazda_device_id),
-            vol.Required("latitude"): cv.latitude,
-            vol.Required("longitude"): cv.longitude,
-            vol.Required("poi_name"): cv.string,
-        }
-    )
+    last_poll_started: float | None = None
 
     async def async_update_data():
         """Fetch data from Mazda API."""
+        nonlocal last_poll_started
+        poll_started = time.monotonic()
         try:
-            vehicles = await with_timeout(mazda_client.get_vehicles())
+            # Work on copies of the client's cached vehicle list, so the data from the
+            # previous poll is kept intact to compare against
+            vehicles = [
+                dict(vehicle)
+                for vehicle in await with_timeout(mazda_client.get_vehicles())
+            ]
+
+            # Entities are created during setup and keep an index into the vehicle
+            # list, so reload the config entry when vehicles have been added, removed
+            # or reordered after the first refresh
+            previous_vins = [vehicle["vin"] for vehicle in entry_data[DATA_VEHICLES]]
+            if coordinator.data is not None and previous_vins != [
+                vehicle["vin"] for vehicle in vehicles
+            ]:
+                hass.async_create_task(
+                    hass.config_entries.async_reload(entry.entry_id)
+                )
+                return entry_data[DATA_VEHICLES]
+
+            previous_vehicles = {
+                vehicle["id"]: vehicle for vehicle in entry_data[DATA_VEHICLES]
+            }
+
+            status_changed = False
 
             # The Mazda API can throw an error when multiple simultaneous requests are
             # made for the same account, so we can only make one request at a time here
             for vehicle in vehicles:
+                previous_vehicle = previous_vehicles.get(vehicle["id"], {})
+
                 vehicle["status"] = await with_timeout(
                     mazda_client.get_vehicle_status(vehicle["id"])
                 )
@@ -169,15 +216,39 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         mazda_client.get_hvac_setting(vehicle["id"])
                     )
 
-            hass.data[DOMAIN][entry.entry_id][DATA_VEHICLES] = vehicles
+                if previous_vehicle.get("status") != vehicle["status"] or (
+                    previous_vehicle.get("evStatus") != vehicle.get("evStatus")
+                ):
+                    status_changed = True
+
+            # Poll less often while nothing changes (e.g. the vehicle is parked),
+            # and go back to the regular interval as soon as something does. Only
+            # back off on scheduled polls, since a refresh requested right after a
+            # command is expected to still return the old status. The refresh timer
+            # is rounded to whole seconds, so allow it to fire a second early.
+            if status_changed:
+                coordinator.update_interval = UPDATE_INTERVAL
+            elif (
+                last_poll_started is not None
+                and poll_started - last_poll_started
+                >= coordinator.update_interval.total_seconds() - 1
+            ):
+                coordinator.update_interval = min(
+                    coordinator.update_interval * 2, MAX_UPDATE_INTERVAL
+                )
+            last_poll_started = poll_started
+
+            entry_data[DATA_VEHICLES] = vehicles
+            vin_index.update(
+                (vehicle["vin"], (mazda_client, vehicle["id"])) for vehicle in vehicles
+            )
 
             return vehicles
         except MazdaAuthenticationException as ex:
             raise ConfigEntryAuthFailed("Not authenticated with Mazda API") from ex
-        except Exception as ex:
-            _LOGGER.exception(
-                "Unknown error occurred during Mazda update request: %s", ex
-            )
+        except MAZDA_ERRORS as ex:
+            # The failure may be caused by a vehicle that is no longer on the account
+            mazda_client.invalidate_vehicle_list_cache()
             raise UpdateFailed(ex) from ex
 
     coordinator = DataUpdateCoordinator(
@@ -185,16 +256,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER,
         name=DOMAIN,
         update_method=async_update_data,
-        update_interval=timedelta(seconds=180),
+        update_interval=UPDATE_INTERVAL,
     )
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
+    entry_data = {
         DATA_CLIENT: mazda_client,
         DATA_COORDINATOR: coordinator,
         DATA_REGION: region,
         DATA_VEHICLES: [],
     }
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[entry.entry_id] = entry_data
+    vin_index = domain_data.setdefault(DATA_VIN_INDEX, {})
 
     # Fetch initial data so we have data when entities subscribe
     await coordinator.async_config_entry_first_refresh()
@@ -207,7 +280,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         DOMAIN,
         "send_poi",
         async_handle_service_call,
-        schema=service_schema_send_poi,
+        schema=SERVICE_SCHEMA_SEND_POI,
     )
 
     return True
@@ -216,15 +289,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if not unload_ok:
+        return False
 
-    # Only remove services if it is the last config entry
-    if len(hass.data[DOMAIN]) == 1:
-        hass.services.async_remove(DOMAIN, "send_poi")
+    domain_data = hass.data[DOMAIN]
+    entry_data = domain_data.pop(entry.entry_id)
+
+    # Drop the VINs served by this entry's client from the VIN index
+    vin_index = domain_data[DATA_VIN_INDEX]
+    for vehicle in entry_data[DATA_VEHICLES]:
+        api_client, _ = vin_index.get(vehicle["vin"], (None, 0))
+        if api_client is entry_data[DATA_CLIENT]:
+            del vin_index[vehicle["vin"]]
 
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+    # Only remove services if it was the last config entry
+    if domain_data.keys() == {DATA_VIN_INDEX}:
+        hass.services.async_remove(DOMAIN, "send_poi")
+        hass.data.pop(DOMAIN)
 
-    return unload_ok
+    return True
 
 
 class MazdaEntity(CoordinatorEntity):
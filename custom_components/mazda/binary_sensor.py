@@ -18,32 +18,26 @@ from . import MazdaEntity
 from .const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN
 
 
-@dataclass
-class MazdaBinarySensorRequiredKeysMixin:
-    """Mixin for required keys."""
+@dataclass(frozen=True, kw_only=True)
+class MazdaBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a Mazda binary sensor entity."""
 
     # Function to determine the value for this binary sensor, given the coordinator data
     value_fn: Callable[[dict[str, Any]], bool]
 
-
-@dataclass
-class MazdaBinarySensorEntityDescription(
-    BinarySensorEntityDescription, MazdaBinarySensorRequiredKeysMixin
-):
-    """Describes a Mazda binary sensor entity."""
-
     # Function to determine whether the vehicle supports this binary sensor, given the coordinator data
     is_supported: Callable[[dict[str, Any]], bool] = lambda data: True
 
 
 def _plugged_in_supported(data):
     """Determine if 'plugged in' binary sensor is supported."""
-    return (
-        data["isElectric"] and data["evStatus"]["chargeInfo"]["pluggedIn"] is not None
-    )
+    if not data.get("isElectric"):
+        return False
+    charge_info = (data.get("evStatus") or {}).get("chargeInfo") or {}
+    return charge_info.get("pluggedIn") is not None
 
 
-BINARY_SENSOR_ENTITIES = [
+BINARY_SENSOR_ENTITIES = (
     MazdaBinarySensorEntityDescription(
         key="driver_door",
         translation_key="driver_door",
@@ -93,7 +87,7 @@ BINARY_SENSOR_ENTITIES = [
         is_supported=_plugged_in_supported,
         value_fn=lambda data: data["evStatus"]["chargeInfo"]["pluggedIn"],
     ),
-]
+)
 
 
 async def async_setup_entry(
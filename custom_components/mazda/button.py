@@ -13,16 +13,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import (
-    MazdaAccountLockedException,
+    MAZDA_ERRORS,
     MazdaAPI as MazdaAPIClient,
-    MazdaAPIEncryptionException,
-    MazdaAuthenticationException,
     MazdaEntity,
-    MazdaException,
-    MazdaTokenExpiredException,
+    async_reset_update_interval,
 )
 from .const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN
-from .pymazda.exceptions import MazdaLoginFailedException
 
 
 async def handle_button_press(
@@ -36,16 +32,11 @@ async def handle_button_press(
 
     try:
         await api_method(vehicle_id)
-    except (
-        MazdaException,
-        MazdaAuthenticationException,
-        MazdaAccountLockedException,
-        MazdaTokenExpiredException,
-        MazdaAPIEncryptionException,
-        MazdaLoginFailedException,
-    ) as ex:
+    except MAZDA_ERRORS as ex:
         raise HomeAssistantError(ex) from ex
 
+    async_reset_update_interval(coordinator)
+
 
 async def handle_refresh_vehicle_status(
     client: MazdaAPIClient,
@@ -59,7 +50,7 @@ async def handle_refresh_vehicle_status(
     await coordinator.async_request_refresh()
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class MazdaButtonEntityDescription(ButtonEntityDescription):
     """Describes a Mazda button entity."""
 
@@ -72,7 +63,7 @@ class MazdaButtonEntityDescription(ButtonEntityDescription):
     ] = handle_button_press
 
 
-BUTTON_ENTITIES = [
+BUTTON_ENTITIES = (
     MazdaButtonEntityDescription(
         key="start_engine",
         translation_key="start_engine",
@@ -104,7 +95,7 @@ BUTTON_ENTITIES = [
         async_press=handle_refresh_vehicle_status,
         is_supported=lambda data: data["isElectric"],
     ),
-]
+)
 
 
 async def async_setup_entry(
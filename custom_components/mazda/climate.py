@@ -20,7 +20,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util.unit_conversion import TemperatureConverter
 
-from . import MazdaAPI as MazdaAPIClient, MazdaEntity
+from . import (
+    MazdaAPI as MazdaAPIClient,
+    MazdaEntity,
+    async_reset_update_interval,
+)
 from .const import DATA_CLIENT, DATA_COORDINATOR, DATA_REGION, DOMAIN
 
 PRESET_DEFROSTER_OFF = "Defroster Off"
@@ -153,6 +157,7 @@ class MazdaClimateEntity(MazdaEntity, ClimateEntity):
             await self.client.turn_on_hvac(self.vehicle_id)
         elif hvac_mode == HVACMode.OFF:
             await self.client.turn_off_hvac(self.vehicle_id)
+        async_reset_update_interval(self.coordinator)
 
         self._handle_coordinator_update()
 
@@ -169,6 +174,7 @@ class MazdaClimateEntity(MazdaEntity, ClimateEntity):
                 _front_defroster_enabled(self._attr_preset_mode),
                 _rear_defroster_enabled(self._attr_preset_mode),
             )
+            async_reset_update_interval(self.coordinator)
 
             self._handle_coordinator_update()
 
@@ -181,5 +187,6 @@ class MazdaClimateEntity(MazdaEntity, ClimateEntity):
             _front_defroster_enabled(preset_mode),
             _rear_defroster_enabled(preset_mode),
         )
+        async_reset_update_interval(self.coordinator)
 
         self._handle_coordinator_update()
@@ -83,17 +83,21 @@ class MazdaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="reauth_successful")
 
         return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_EMAIL, default=self._email): str,
-                    vol.Required(CONF_PASSWORD): str,
-                    vol.Required(CONF_REGION, default=self._region): vol.In(
-                        MAZDA_REGIONS
-                    ),
-                }
-            ),
-            errors=errors,
+            step_id="user", data_schema=self._user_schema(), errors=errors
+        )
+
+    def _user_schema(self) -> vol.Schema:
+        """Return the user step schema, prefilled with any known values."""
+        # Only build a new schema when there are defaults to fill in
+        if self._email is None and self._region is None:
+            return DATA_SCHEMA
+
+        return vol.Schema(
+            {
+                vol.Required(CONF_EMAIL, default=self._email): str,
+                vol.Required(CONF_PASSWORD): str,
+                vol.Required(CONF_REGION, default=self._region): vol.In(MAZDA_REGIONS),
+            }
         )
 
     async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
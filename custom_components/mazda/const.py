@@ -6,5 +6,6 @@ DATA_CLIENT = "mazda_client"
 DATA_COORDINATOR = "coordinator"
 DATA_REGION = "region"
 DATA_VEHICLES = "vehicles"
+DATA_VIN_INDEX = "vin_index"
 
 MAZDA_REGIONS = {"MNAO": "North America", "MME": "Europe", "MJO": "Japan"}
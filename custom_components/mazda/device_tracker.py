@@ -17,12 +17,10 @@ async def async_setup_entry(
     client = hass.data[DOMAIN][config_entry.entry_id][DATA_CLIENT]
     coordinator = hass.data[DOMAIN][config_entry.entry_id][DATA_COORDINATOR]
 
-    entities = []
-
-    for index, _ in enumerate(coordinator.data):
-        entities.append(MazdaDeviceTracker(client, coordinator, index))
-
-    async_add_entities(entities)
+    async_add_entities(
+        MazdaDeviceTracker(client, coordinator, index)
+        for index in range(len(coordinator.data))
+    )
 
 
 class MazdaDeviceTracker(MazdaEntity, TrackerEntity):
@@ -12,8 +12,8 @@ from homeassistant.helpers.device_registry import DeviceEntry
 
 from .const import DATA_COORDINATOR, DOMAIN
 
-TO_REDACT_INFO = [CONF_EMAIL, CONF_PASSWORD]
-TO_REDACT_DATA = ["vin", "id", "latitude", "longitude"]
+TO_REDACT_INFO = {CONF_EMAIL, CONF_PASSWORD}
+TO_REDACT_DATA = {"vin", "id", "latitude", "longitude"}
 
 
 async def async_get_config_entry_diagnostics(
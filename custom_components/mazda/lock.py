@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import MazdaEntity
+from . import MazdaEntity, async_reset_update_interval
 from .const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN
 
 
@@ -21,12 +21,10 @@ async def async_setup_entry(
     client = hass.data[DOMAIN][config_entry.entry_id][DATA_CLIENT]
     coordinator = hass.data[DOMAIN][config_entry.entry_id][DATA_COORDINATOR]
 
-    entities = []
-
-    for index, _ in enumerate(coordinator.data):
-        entities.append(MazdaLock(client, coordinator, index))
-
-    async_add_entities(entities)
+    async_add_entities(
+        MazdaLock(client, coordinator, index)
+        for index in range(len(coordinator.data))
+    )
 
 
 class MazdaLock(MazdaEntity, LockEntity):
@@ -48,11 +46,13 @@ class MazdaLock(MazdaEntity, LockEntity):
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the vehicle doors."""
         await self.client.lock_doors(self.vehicle_id)
+        async_reset_update_interval(self.coordinator)
 
         self.async_write_ha_state()
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the vehicle doors."""
         await self.client.unlock_doors(self.vehicle_id)
+        async_reset_update_interval(self.coordinator)
 
         self.async_write_ha_state()
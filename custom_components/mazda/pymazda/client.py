@@ -1,9 +1,12 @@
 import datetime  # noqa: D100
 import json
+import time
 
 from .controller import Controller
 from .exceptions import MazdaConfigException
 
+VEHICLE_LIST_CACHE_DURATION = 6 * 60 * 60
+
 
 class Client:  # noqa: D101
     def __init__(  # noqa: D107
@@ -19,12 +22,17 @@ class Client:  # noqa: D101
         self._cached_state = {}
         self._use_cached_vehicle_list = use_cached_vehicle_list
         self._cached_vehicle_list = None
+        self._cached_vehicle_list_expiry = 0
 
     async def validate_credentials(self):  # noqa: D102
         await self.controller.login()
 
     async def get_vehicles(self):  # noqa: D102
-        if self._use_cached_vehicle_list and self._cached_vehicle_list is not None:
+        if (
+            self._use_cached_vehicle_list
+            and self._cached_vehicle_list is not None
+            and time.monotonic() < self._cached_vehicle_list_expiry
+        ):
             return self._cached_vehicle_list
 
         vec_base_infos_response = await self.controller.get_vec_base_infos()
@@ -39,8 +47,9 @@ class Client:  # noqa: D101
             if current_vehicle_flags.get("vinRegistStatus") != 3:
                 continue
 
-            other_veh_info = json.loads(
-                current_vec_base_info.get("Vehicle").get("vehicleInformation")
+            vehicle_info = current_vec_base_info.get("Vehicle", {})
+            other_info = json.loads(vehicle_info.get("vehicleInformation")).get(
+                "OtherInformation", {}
             )
 
             nickname = await self.controller.get_nickname(
@@ -49,41 +58,18 @@ class Client:  # noqa: D101
 
             vehicle = {
                 "vin": current_vec_base_info.get("vin"),
-                "id": current_vec_base_info.get("Vehicle", {})
-                .get("CvInformation", {})
-                .get("internalVin"),
+                "id": vehicle_info.get("CvInformation", {}).get("internalVin"),
                 "nickname": nickname,
-                "carlineCode": other_veh_info.get("OtherInformation", {}).get(
-                    "carlineCode"
-                ),
-                "carlineName": other_veh_info.get("OtherInformation", {}).get(
-                    "carlineName"
-                ),
-                "modelYear": other_veh_info.get("OtherInformation", {}).get(
-                    "modelYear"
-                ),
-                "modelCode": other_veh_info.get("OtherInformation", {}).get(
-                    "modelCode"
-                ),
-                "modelName": other_veh_info.get("OtherInformation", {}).get(
-                    "modelName"
-                ),
-                "automaticTransmission": other_veh_info.get("OtherInformation", {}).get(
-                    "transmissionType"
-                )
-                == "A",
-                "interiorColorCode": other_veh_info.get("OtherInformation", {}).get(
-                    "interiorColorCode"
-                ),
-                "interiorColorName": other_veh_info.get("OtherInformation", {}).get(
-                    "interiorColorName"
-                ),
-                "exteriorColorCode": other_veh_info.get("OtherInformation", {}).get(
-                    "exteriorColorCode"
-                ),
-                "exteriorColorName": other_veh_info.get("OtherInformation", {}).get(
-                    "exteriorColorName"
-                ),
+                "carlineCode": other_info.get("carlineCode"),
+                "carlineName": other_info.get("carlineName"),
+                "modelYear": other_info.get("modelYear"),
+                "modelCode": other_info.get("modelCode"),
+                "modelName": other_info.get("modelName"),
+                "automaticTransmission": other_info.get("transmissionType") == "A",
+                "interiorColorCode": other_info.get("interiorColorCode"),
+                "interiorColorName": other_info.get("interiorColorName"),
+                "exteriorColorCode": other_info.get("exteriorColorCode"),
+                "exteriorColorName": other_info.get("exteriorColorName"),
                 "isElectric": current_vec_base_info.get("econnectType", 0) == 1,
             }
 
@@ -91,84 +77,69 @@ class Client:  # noqa: D101
 
         if self._use_cached_vehicle_list:
             self._cached_vehicle_list = vehicles
+            self._cached_vehicle_list_expiry = (
+                time.monotonic() + VEHICLE_LIST_CACHE_DURATION
+            )
         return vehicles
 
+    def invalidate_vehicle_list_cache(self):  # noqa: D102
+        self._cached_vehicle_list = None
+
     async def get_vehicle_status(self, vehicle_id):  # noqa: D102
         vehicle_status_response = await self.controller.get_vehicle_status(vehicle_id)
 
         alert_info = vehicle_status_response.get("alertInfos")[0]
         remote_info = vehicle_status_response.get("remoteInfos")[0]
+        door_info = alert_info.get("Door", {})
+        window_info = alert_info.get("Pw", {})
+        position_info = remote_info.get("PositionInfo", {})
+        fuel_info = remote_info.get("ResidualFuel", {})
+        tpms_info = remote_info.get("TPMSInformation", {})
 
-        latitude = remote_info.get("PositionInfo", {}).get("Latitude")
+        latitude = position_info.get("Latitude")
         if latitude is not None:
-            latitude = latitude * (
-                -1
-                if remote_info.get("PositionInfo", {}).get("LatitudeFlag") == 1
-                else 1
-            )
-        longitude = remote_info.get("PositionInfo", {}).get("Longitude")
+            latitude = latitude * (-1 if position_info.get("LatitudeFlag") == 1 else 1)
+        longitude = position_info.get("Longitude")
         if longitude is not None:
             longitude = longitude * (
-                1
-                if remote_info.get("PositionInfo", {}).get("LongitudeFlag") == 1
-                else -1
+                1 if position_info.get("LongitudeFlag") == 1 else -1
             )
 
         vehicle_status = {
             "lastUpdatedTimestamp": alert_info.get("OccurrenceDate"),
             "latitude": latitude,
             "longitude": longitude,
-            "positionTimestamp": remote_info.get("PositionInfo", {}).get(
-                "AcquisitionDatetime"
-            ),
-            "fuelRemainingPercent": remote_info.get("ResidualFuel", {}).get(
-                "FuelSegementDActl"
-            ),
-            "fuelDistanceRemainingKm": remote_info.get("ResidualFuel", {}).get(
-                "RemDrvDistDActlKm"
-            ),
+            "positionTimestamp": position_info.get("AcquisitionDatetime"),
+            "fuelRemainingPercent": fuel_info.get("FuelSegementDActl"),
+            "fuelDistanceRemainingKm": fuel_info.get("RemDrvDistDActlKm"),
             "odometerKm": remote_info.get("DriveInformation", {}).get("OdoDispValue"),
             "doors": {
-                "driverDoorOpen": alert_info.get("Door", {}).get("DrStatDrv") == 1,
-                "passengerDoorOpen": alert_info.get("Door", {}).get("DrStatPsngr") == 1,
-                "rearLeftDoorOpen": alert_info.get("Door", {}).get("DrStatRl") == 1,
-                "rearRightDoorOpen": alert_info.get("Door", {}).get("DrStatRr") == 1,
-                "trunkOpen": alert_info.get("Door", {}).get("DrStatTrnkLg") == 1,
-                "hoodOpen": alert_info.get("Door", {}).get("DrStatHood") == 1,
-                "fuelLidOpen": alert_info.get("Door", {}).get("FuelLidOpenStatus") == 1,
+                "driverDoorOpen": door_info.get("DrStatDrv") == 1,
+                "passengerDoorOpen": door_info.get("DrStatPsngr") == 1,
+                "rearLeftDoorOpen": door_info.get("DrStatRl") == 1,
+                "rearRightDoorOpen": door_info.get("DrStatRr") == 1,
+                "trunkOpen": door_info.get("DrStatTrnkLg") == 1,
+                "hoodOpen": door_info.get("DrStatHood") == 1,
+                "fuelLidOpen": door_info.get("FuelLidOpenStatus") == 1,
             },
             "doorLocks": {
-                "driverDoorUnlocked": alert_info.get("Door", {}).get("LockLinkSwDrv")
-                == 1,
-                "passengerDoorUnlocked": alert_info.get("Door", {}).get(
-                    "LockLinkSwPsngr"
-                )
-                == 1,
-                "rearLeftDoorUnlocked": alert_info.get("Door", {}).get("LockLinkSwRl")
-                == 1,
-                "rearRightDoorUnlocked": alert_info.get("Door", {}).get("LockLinkSwRr")
-                == 1,
+                "driverDoorUnlocked": door_info.get("LockLinkSwDrv") == 1,
+                "passengerDoorUnlocked": door_info.get("LockLinkSwPsngr") == 1,
+                "rearLeftDoorUnlocked": door_info.get("LockLinkSwRl") == 1,
+                "rearRightDoorUnlocked": door_info.get("LockLinkSwRr") == 1,
             },
             "windows": {
-                "driverWindowOpen": alert_info.get("Pw", {}).get("PwPosDrv") == 1,
-                "passengerWindowOpen": alert_info.get("Pw", {}).get("PwPosPsngr") == 1,
-                "rearLeftWindowOpen": alert_info.get("Pw", {}).get("PwPosRl") == 1,
-                "rearRightWindowOpen": alert_info.get("Pw", {}).get("PwPosRr") == 1,
+                "driverWindowOpen": window_info.get("PwPosDrv") == 1,
+                "passengerWindowOpen": window_info.get("PwPosPsngr") == 1,
+                "rearLeftWindowOpen": window_info.get("PwPosRl") == 1,
+                "rearRightWindowOpen": window_info.get("PwPosRr") == 1,
             },
             "hazardLightsOn": alert_info.get("HazardLamp", {}).get("HazardSw") == 1,
             "tirePressure": {
-                "frontLeftTirePressurePsi": remote_info.get("TPMSInformation", {}).get(
-                    "FLTPrsDispPsi"
-                ),
-                "frontRightTirePressurePsi": remote_info.get("TPMSInformation", {}).get(
-                    "FRTPrsDispPsi"
-                ),
-                "rearLeftTirePressurePsi": remote_info.get("TPMSInformation", {}).get(
-                    "RLTPrsDispPsi"
-                ),
-                "rearRightTirePressurePsi": remote_info.get("TPMSInformation", {}).get(
-                    "RRTPrsDispPsi"
-                ),
+                "frontLeftTirePressurePsi": tpms_info.get("FLTPrsDispPsi"),
+                "frontRightTirePressurePsi": tpms_info.get("FRTPrsDispPsi"),
+                "rearLeftTirePressurePsi": tpms_info.get("RLTPrsDispPsi"),
+                "rearRightTirePressurePsi": tpms_info.get("RRTPrsDispPsi"),
             },
         }
 
@@ -206,7 +177,7 @@ class Client:  # noqa: D101
             "chargeInfo": {
                 "batteryLevelPercentage": charge_info.get("SmaphSOC"),
                 "drivingRangeKm": charge_info.get("SmaphRemDrvDistKm"),
-                "drivingRangeBevKm" charge_info.get("BatRemDrvDistKm"),
+                "drivingRangeBevKm": charge_info.get("BatRemDrvDistKm"),
                 "pluggedIn": charge_info.get("ChargerConnectorFitting") == 1,
                 "charging": charge_info.get("ChargeStatusSub") == 6,
                 "basicChargeTimeMinutes": charge_info.get("MaxChargeMinuteAC"),
@@ -351,14 +322,15 @@ class Client:  # noqa: D101
         if assumed_value_key not in cached_state and api_value_key in cached_state:
             return cached_state.get(api_value_key)
 
-        now_timestamp = datetime.datetime.now(datetime.UTC)
+        assumed_value_timestamp = cached_state.get(assumed_value_timestamp_key)
+        api_value_timestamp = cached_state.get(api_value_timestamp_key)
 
+        # Only read the clock once the assumed value is known to be the newer one
         if (
-            assumed_value_timestamp_key in cached_state
-            and api_value_timestamp_key in cached_state
-            and cached_state.get(assumed_value_timestamp_key)
-            > cached_state.get(api_value_timestamp_key)
-            and (now_timestamp - cached_state.get(assumed_value_timestamp_key))
+            assumed_value_timestamp is not None
+            and api_value_timestamp is not None
+            and assumed_value_timestamp > api_value_timestamp
+            and (datetime.datetime.now(datetime.UTC) - assumed_value_timestamp)
             < assumed_state_validity_duration
         ):
             return cached_state.get(assumed_value_key)
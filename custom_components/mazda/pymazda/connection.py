@@ -3,11 +3,13 @@ import base64
 import hashlib
 import json
 import logging
+import random
 import ssl
 import time
 from urllib.parse import urlencode
 
 import aiohttp
+import orjson
 
 from .crypto_utils import (
     decrypt_aes128cbc_buffer_to_str,
@@ -63,6 +65,11 @@ USHER_SDK_VERSION = "11.3.0700.001"
 
 MAX_RETRIES = 4
 
+# The vehicle can take tens of seconds to finish processing a previous remote command,
+# so the retries together still wait for about two minutes
+REQUEST_IN_PROGRESS_BASE_DELAY = 15
+REQUEST_IN_PROGRESS_MAX_DELAY = 30
+
 
 class Connection:
     """Main class for handling MyMazda API connection."""
@@ -86,7 +93,12 @@ class Connection:
         self.sign_key = None
 
         self.access_token = None
-        self.access_token_expiration_ts = None
+        self.access_token_expiry = None
+
+        # Requests that find the keys or the token missing at the same time wait for a
+        # single retrieval instead of each starting their own
+        self._keys_lock = asyncio.Lock()
+        self._login_lock = asyncio.Lock()
 
         self.sensor_data_builder = SensorDataBuilder()
 
@@ -162,7 +174,7 @@ class Connection:
         buf = base64.b64decode(payload)
         key = self.__get_decryption_key_from_app_code()
         decrypted = decrypt_aes128cbc_buffer_to_str(buf, key, IV)
-        return json.loads(decrypted)
+        return orjson.loads(decrypted)
 
     def __decrypt_payload_using_key(self, payload):
         if self.enc_key is None or self.enc_key == "":
@@ -170,7 +182,7 @@ class Connection:
 
         buf = base64.b64decode(payload)
         decrypted = decrypt_aes128cbc_buffer_to_str(buf, self.enc_key, IV)
-        return json.loads(decrypted)
+        return orjson.loads(decrypted)
 
     def __encrypt_payload_with_public_key(self, password, public_key):
         timestamp = self.__get_timestamp_str()
@@ -210,12 +222,16 @@ class Connection:
         if needs_auth:
             await self.__ensure_token_is_valid()
 
-        retry_message = (
-            (" - attempt #" + str(num_retries + 1)) if (num_retries > 0) else ""
-        )
-        self.logger.debug(
-            f"Sending {method} request to {uri}{retry_message}"  # noqa: G004
-        )  # noqa: G004
+        if num_retries > 0:
+            self.logger.debug(
+                "Sending %s request to %s - attempt #%d", method, uri, num_retries + 1
+            )
+        else:
+            self.logger.debug("Sending %s request to %s", method, uri)
+
+        # Remember which token the request is sent with, to tell whether another
+        # request already logged in again if this one gets rejected
+        access_token = self.access_token
 
         try:
             return await self.__send_api_request(
@@ -239,7 +255,7 @@ class Connection:
             self.logger.info(
                 "Server reports access token was expired. Retrieving new access token."
             )
-            await self.login()
+            await self.__login_if_token_unchanged(access_token)
             return await self.__api_request_retry(
                 method,
                 uri,
@@ -251,7 +267,7 @@ class Connection:
             )
         except MazdaLoginFailedException:
             self.logger.warning("Login failed for an unknown reason. Trying again.")
-            await self.login()
+            await self.__login_if_token_unchanged(access_token)
             return await self.__api_request_retry(
                 method,
                 uri,
@@ -262,10 +278,19 @@ class Connection:
                 num_retries + 1,
             )
         except MazdaRequestInProgressException:
+            # Don't wait before an attempt that would only be rejected for exceeding the retry limit
+            if num_retries >= MAX_RETRIES:
+                raise MazdaException("Request exceeded max number of retries")
+
+            delay = min(
+                REQUEST_IN_PROGRESS_MAX_DELAY,
+                REQUEST_IN_PROGRESS_BASE_DELAY * 2**num_retries,
+            ) * random.uniform(0.8, 1.2)
             self.logger.info(
-                "Request failed because another request was already in progress. Waiting 30 seconds and trying again."
+                "Request failed because another request was already in progress. Waiting %.1f seconds and trying again.",
+                delay,
             )
-            await asyncio.sleep(30)
+            await asyncio.sleep(delay)
             return await self.__api_request_retry(
                 method,
                 uri,
@@ -334,7 +359,7 @@ class Connection:
             ssl=ssl_context,
         )
 
-        response_json = await response.json()
+        response_json = await response.json(loads=orjson.loads)
 
         if response_json.get("state") == "S":
             if "checkVersion" in uri:
@@ -369,24 +394,29 @@ class Connection:
             raise MazdaException("Request failed for an unknown reason")
 
     async def __ensure_keys_present(self):
-        if self.enc_key is None or self.sign_key is None:
-            await self.__retrieve_keys()
+        async with self._keys_lock:
+            if self.enc_key is None or self.sign_key is None:
+                await self.__retrieve_keys()
 
     async def __ensure_token_is_valid(self):
-        if self.access_token is None or self.access_token_expiration_ts is None:
-            self.logger.info("No access token present. Logging in.")
-        elif self.access_token_expiration_ts <= time.time():
-            self.logger.info("Access token is expired. Fetching a new one.")
-            self.access_token = None
-            self.access_token_expiration_ts = None
-
-        if (
-            self.access_token is None
-            or self.access_token_expiration_ts is None
-            or self.access_token_expiration_ts <= time.time()
-        ):
+        async with self._login_lock:
+            if self.access_token is None or self.access_token_expiry is None:
+                self.logger.info("No access token present. Logging in.")
+            elif self.access_token_expiry <= time.monotonic():
+                self.logger.info("Access token is expired. Fetching a new one.")
+                self.access_token = None
+                self.access_token_expiry = None
+            else:
+                return
+
             await self.login()
 
+    async def __login_if_token_unchanged(self, rejected_access_token):
+        async with self._login_lock:
+            # Another request may have logged in while this one was waiting
+            if self.access_token == rejected_access_token:
+                await self.login()
+
     async def __retrieve_keys(self):
         self.logger.info("Retrieving encryption keys")
         response = await self.api_request(
@@ -413,7 +443,9 @@ class Connection:
             ssl=ssl_context,
         )
 
-        encryption_key_response_json = await encryption_key_response.json()
+        encryption_key_response_json = await encryption_key_response.json(
+            loads=orjson.loads
+        )
 
         public_key = encryption_key_response_json["data"]["publicKey"]
         encrypted_password = self.__encrypt_payload_with_public_key(
@@ -438,7 +470,7 @@ class Connection:
             ssl=ssl_context,
         )
 
-        login_response_json = await login_response.json()
+        login_response_json = await login_response.json(loads=orjson.loads)
 
         if login_response_json.get("status") == "INVALID_CREDENTIAL":
             self.logger.error("Login failed due to invalid email or password")
@@ -459,9 +491,11 @@ class Connection:
 
         self.logger.info("Successfully logged in as " + self.email)  # noqa: G003
         self.access_token = login_response_json["data"]["accessToken"]
-        self.access_token_expiration_ts = login_response_json["data"][
-            "accessTokenExpirationTs"
-        ]
+        # The server reports the expiration as a Unix timestamp, convert it to a
+        # monotonic deadline so that wall clock changes don't affect it
+        self.access_token_expiry = time.monotonic() + (
+            login_response_json["data"]["accessTokenExpirationTs"] - time.time()
+        )
 
     async def close(self):  # noqa: D102
         await self._session.close()
@@ -21,21 +21,14 @@ from . import MazdaEntity
 from .const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN
 
 
-@dataclass
-class MazdaSensorRequiredKeysMixin:
-    """Mixin for required keys."""
+@dataclass(frozen=True, kw_only=True)
+class MazdaSensorEntityDescription(SensorEntityDescription):
+    """Describes a Mazda sensor entity."""
 
     # Function to determine the value for this sensor, given the coordinator data
     # and the configured unit system
     value: Callable[[dict[str, Any]], StateType]
 
-
-@dataclass
-class MazdaSensorEntityDescription(
-    SensorEntityDescription, MazdaSensorRequiredKeysMixin
-):
-    """Describes a Mazda sensor entity."""
-
     # Function to determine whether the vehicle supports this sensor,
     # given the coordinator data
     is_supported: Callable[[dict[str, Any]], bool] = lambda data: True
@@ -75,33 +68,28 @@ def _rear_right_tire_pressure_supported(data):
     return data["status"]["tirePressure"]["rearRightTirePressurePsi"] is not None
 
 
+def _ev_charge_info(data):
+    """Get the EV charge info, or an empty dict if it is not available."""
+    if not data.get("isElectric"):
+        return {}
+    return (data.get("evStatus") or {}).get("chargeInfo") or {}
+
+
 def _ev_charge_level_supported(data):
     """Determine if charge level is supported."""
-    return (
-        data["isElectric"]
-        and data["evStatus"]["chargeInfo"]["batteryLevelPercentage"] is not None
-    )
+    return _ev_charge_info(data).get("batteryLevelPercentage") is not None
 
 def _ev_remaining_charging_time_supported(data):
     """Determine if remaining changing time is supported."""
-    return (
-        data["isElectric"]
-        and data["evStatus"]["chargeInfo"]["basicChargeTimeMinutes"] is not None
-    )
+    return _ev_charge_info(data).get("basicChargeTimeMinutes") is not None
 
 def _ev_remaining_range_supported(data):
     """Determine if remaining range is supported."""
-    return (
-        data["isElectric"]
-        and data["evStatus"]["chargeInfo"]["drivingRangeKm"] is not None
-    )
+    return _ev_charge_info(data).get("drivingRangeKm") is not None
 
 def _ev_remaining_bev_range_supported(data):
     """Determine if remaining range bev is supported."""
-    return (
-        data["isElectric"]
-        and data["evStatus"]["chargeInfo"]["drivingRangeBevKm"] is not None
-    )
+    return _ev_charge_info(data).get("drivingRangeBevKm") is not None
 
 def _fuel_distance_remaining_value(data):
     """Get the fuel distance remaining value."""
@@ -151,7 +139,7 @@ def _ev_remaining_range_bev_value(data):
     return round(data["evStatus"]["chargeInfo"]["drivingRangeBevKm"])
 
 
-SENSOR_ENTITIES = [
+SENSOR_ENTITIES = (
     MazdaSensorEntityDescription(
         key="fuel_remaining_percentage",
         translation_key="fuel_remaining_percentage",
@@ -259,7 +247,7 @@ SENSOR_ENTITIES = [
         is_supported=_ev_remaining_bev_range_supported,
         value=_ev_remaining_range_bev_value,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -271,16 +259,12 @@ async def async_setup_entry(
     client = hass.data[DOMAIN][config_entry.entry_id][DATA_CLIENT]
     coordinator = hass.data[DOMAIN][config_entry.entry_id][DATA_COORDINATOR]
 
-    entities: list[SensorEntity] = []
-
-    for index, data in enumerate(coordinator.data):
-        for description in SENSOR_ENTITIES:
-            if description.is_supported(data):
-                entities.append(
-                    MazdaSensorEntity(client, coordinator, index, description)
-                )
-
-    async_add_entities(entities)
+    async_add_entities(
+        MazdaSensorEntity(client, coordinator, index, description)
+        for index, data in enumerate(coordinator.data)
+        for description in SENSOR_ENTITIES
+        if description.is_supported(data)
+    )
 
 
 class MazdaSensorEntity(MazdaEntity, SensorEntity):
@@ -3,13 +3,23 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from . import MazdaAPI as MazdaAPIClient, MazdaEntity
+from . import (
+    MAZDA_ERRORS,
+    MazdaAPI as MazdaAPIClient,
+    MazdaEntity,
+    async_reset_update_interval,
+)
 from .const import DATA_CLIENT, DATA_COORDINATOR, DOMAIN
 
+# Seconds to give the vehicle to report its new status before polling it again
+STATUS_REFRESH_DELAY = 30
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -44,27 +54,66 @@ class MazdaChargingSwitch(MazdaEntity, SwitchEntity):
 
         self._attr_unique_id = self.vin
 
+        self._cancel_refresh: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Cancel any scheduled status refresh when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_refresh)
+
+    @callback
+    def _async_cancel_refresh(self) -> None:
+        """Cancel the scheduled status refresh, if there is one."""
+        if self._cancel_refresh is not None:
+            self._cancel_refresh()
+            self._cancel_refresh = None
+
     @property
     def is_on(self):
         """Return true if the vehicle is charging."""
         return self.data["evStatus"]["chargeInfo"]["charging"]
 
-    async def refresh_status_and_write_state(self):
-        """Request a status update, retrieve it through the coordinator, and write the state."""
-        await self.client.refresh_vehicle_status(self.vehicle_id)
-
+    async def set_charging_and_refresh_status(self, charging: bool):
+        """Assume the new charging state, and request a status update to confirm it."""
+        ev_status = self.data["evStatus"]
+        self.data["evStatus"] = {
+            **ev_status,
+            "chargeInfo": {**ev_status["chargeInfo"], "charging": charging},
+        }
+        async_reset_update_interval(self.coordinator)
+
+        try:
+            await self.client.refresh_vehicle_status(self.vehicle_id)
+        except MAZDA_ERRORS as ex:
+            raise HomeAssistantError(ex) from ex
+        finally:
+            # Also confirm the assumed state when the vehicle could not be asked
+            # to report. Toggling again before the refresh ran replaces the
+            # pending refresh.
+            self._async_cancel_refresh()
+            self._cancel_refresh = async_call_later(
+                self.hass, STATUS_REFRESH_DELAY, self._async_request_coordinator_refresh
+            )
+
+    async def _async_request_coordinator_refresh(self, _now) -> None:
+        """Retrieve the status reported by the vehicle through the coordinator."""
+        self._cancel_refresh = None
         await self.coordinator.async_request_refresh()
 
-        self.async_write_ha_state()
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Start charging the vehicle."""
-        await self.client.start_charging(self.vehicle_id)
+        try:
+            await self.client.start_charging(self.vehicle_id)
+        except MAZDA_ERRORS as ex:
+            raise HomeAssistantError(ex) from ex
 
-        await self.refresh_status_and_write_state()
+        await self.set_charging_and_refresh_status(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Stop charging the vehicle."""
-        await self.client.stop_charging(self.vehicle_id)
+        try:
+            await self.client.stop_charging(self.vehicle_id)
+        except MAZDA_ERRORS as ex:
+            raise HomeAssistantError(ex) from ex
 
-        await self.refresh_status_and_write_state()
+        await self.set_charging_and_refresh_status(False)